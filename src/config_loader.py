@@ -2,9 +2,17 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
 
 import boto3
+from botocore.config import Config
+
+try:
+    # Optional: orjson parses several times faster than the stdlib json module
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from .models import (
     ModelConfig,
@@ -13,13 +21,24 @@ from .models import (
     RuleCondition,
     RuleConditionRange,
     RetryPolicy,
+    RULE_TREE_WILDCARD,
 )
+from .utils.rule_compiler import compile_condition
+from .utils.strings import intern_literal
 
 
 class ConfigLoader:
     """
     Loads models.json and routing_rules.json from S3 and parses into RouterConfig.
     Caches in memory for Lambda warm invocations.
+
+    When the configs are bundled into the deployment package (or a layer) together
+    with a config_manifest.json whose "version" matches the CONFIG_VERSION env var,
+    the bundled copies are used and S3 is skipped entirely.
+
+    Configs fetched from S3 are also written to a /tmp cache together with their
+    ETags; a later cold start in the same environment only issues HEAD requests
+    and reuses that copy while the ETags still match.
     """
 
     def __init__(
@@ -40,10 +59,21 @@ class ConfigLoader:
         self.models_path = os.environ.get("MODEL_ROUTER_MODELS_PATH", "models.json")
         self.rules_path = os.environ.get("MODEL_ROUTER_RULES_PATH", "routing_rules.json")
 
+        # Bundled configuration (deployment package / layer root)
+        self.bundle_dir = os.environ.get(
+            "MODEL_ROUTER_BUNDLE_DIR", os.environ.get("LAMBDA_TASK_ROOT", ".")
+        )
+        self.config_version = os.environ.get("CONFIG_VERSION")
+
+        # Scratch-disk copy of the S3 configs (empty string disables it)
+        self.tmp_cache_path = os.environ.get(
+            "MODEL_ROUTER_TMP_CACHE_PATH", "/tmp/router_config_cache.json"
+        )
+
         if self._fetch_from_s3 and not self.bucket:
             raise ValueError("MODEL_ROUTER_CONFIG_BUCKET is required when FETCH_DRIVE=true")
 
-        self._s3 = boto3.client("s3")
+        self._s3 = boto3.client("s3", config=Config(tcp_keepalive=True))
         self._cache: RouterConfig | None = None
 
 
@@ -51,23 +81,17 @@ class ConfigLoader:
         if self._cache is not None and not force_reload:
             return self._cache
 
-        # Load config from S3 or local filesystem
-        if self._fetch_from_s3:
-            # Load models.json from S3
-            models_resp = self._s3.get_object(Bucket=self.bucket, Key=self.models_key)
-            models_data = json.loads(models_resp["Body"].read())
-
-            # Load routing_rules.json from S3
-            rules_resp = self._s3.get_object(Bucket=self.bucket, Key=self.rules_key)
-            rules_data = json.loads(rules_resp["Body"].read())
+        # Load config from bundle, S3 or local filesystem
+        if self._fetch_from_s3 and self._bundle_is_current():
+            # Bundled copy matches the deployed CONFIG_VERSION, skip the S3 round-trips
+            models_data = self._read_local_json(self._bundled_path(self.models_key))
+            rules_data = self._read_local_json(self._bundled_path(self.rules_key))
+        elif self._fetch_from_s3:
+            models_data, rules_data = self._load_from_s3()
         else:
-            # Load models.json from local path
-            with open(self.models_path, "r", encoding="utf-8") as f:
-                models_data = json.load(f)
-
-            # Load routing_rules.json from local path
-            with open(self.rules_path, "r", encoding="utf-8") as f:
-                rules_data = json.load(f)
+            # Load models.json and routing_rules.json from local path
+            models_data = self._read_local_json(self.models_path)
+            rules_data = self._read_local_json(self.rules_path)
 
         models_dict: Dict[str, ModelConfig] = {}
         for m in models_data.get("models", []):
@@ -95,14 +119,19 @@ class ConfigLoader:
         rules: List[RoutingRule] = []
         for r in rules_data.get("rules", []):
             cond_raw = r.get("when", {})
+            tenant_tiers = cond_raw.get("tenant_tier") or []
+            if isinstance(tenant_tiers, str):
+                # A single tier may be given as a bare string
+                tenant_tiers = [tenant_tiers]
             ctx_range = cond_raw.get("context_tokens")
             chunk_range = cond_raw.get("chunk_tokens")
 
             condition = RuleCondition(
-                task_type=cond_raw.get("task_type"),
-                complexity=cond_raw.get("complexity"),
-                language=cond_raw.get("language"),
-                tenant_tiers=cond_raw.get("tenant_tier"),
+                # Empty values mean "unset", the same as a missing key
+                task_type=intern_literal(cond_raw.get("task_type") or None),
+                complexity=intern_literal(cond_raw.get("complexity") or None),
+                language=intern_literal(cond_raw.get("language") or None),
+                tenant_tiers=[intern_literal(t) for t in tenant_tiers],
                 context_tokens_range=RuleConditionRange(
                     gte=ctx_range.get("gte"), lt=ctx_range.get("lt")
                 )
@@ -120,6 +149,7 @@ class ConfigLoader:
                 when=condition,
                 use_model=r["use_model"],
                 override_params=r.get("override_params", {}),
+                match=compile_condition(condition),
             )
             rules.append(rule)
 
@@ -129,6 +159,107 @@ class ConfigLoader:
             rules=rules,
             default_chat_model_id=defaults.get("chat"),
             default_embedding_model_id=defaults.get("embedding"),
+            rule_tree=self._build_rule_tree(rules),
         )
         self._cache = cfg
         return cfg
+
+    def _build_rule_tree(
+        self, rules: List[RoutingRule]
+    ) -> Dict[str, Dict[str, List[RoutingRule]]]:
+        # Split rules on task_type, then complexity, so selection reaches the few rules
+        # that can match with two dict lookups. Each leaf holds every rule whose
+        # equality conditions accept that (task_type, complexity), keeping file order;
+        # the wildcard key covers values that no rule names explicitly.
+        task_types = {r.when.task_type for r in rules if r.when.task_type}
+        complexities = {r.when.complexity for r in rules if r.when.complexity}
+        task_types.add(RULE_TREE_WILDCARD)
+        complexities.add(RULE_TREE_WILDCARD)
+
+        tree: Dict[str, Dict[str, List[RoutingRule]]] = {}
+        for task_type in task_types:
+            tree[task_type] = {
+                complexity: [
+                    r
+                    for r in rules
+                    if (not r.when.task_type or r.when.task_type == task_type)
+                    and (not r.when.complexity or r.when.complexity == complexity)
+                ]
+                for complexity in complexities
+            }
+        return tree
+
+    def _bundle_is_current(self) -> bool:
+        if not self.config_version:
+            return False
+        manifest_path = os.path.join(self.bundle_dir, "config_manifest.json")
+        if not os.path.isfile(manifest_path):
+            return False
+        manifest = self._read_local_json(manifest_path)
+        if manifest.get("version") != self.config_version:
+            return False
+        # A matching manifest without both config files falls back to S3
+        return all(
+            os.path.isfile(self._bundled_path(key)) for key in (self.models_key, self.rules_key)
+        )
+
+    def _bundled_path(self, key: str) -> str:
+        return os.path.join(self.bundle_dir, os.path.basename(key))
+
+    def _read_local_json(self, path: str) -> Dict[str, Any]:
+        # Read raw bytes: both parsers accept UTF-8 bytes without a separate decode
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
+
+    def _load_from_s3(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        keys = (self.models_key, self.rules_key)
+
+        # Reuse the /tmp copy if S3 still holds the same objects (HEAD is cheaper than GET)
+        cached = self._read_tmp_cache()
+        if cached is not None:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                etags = list(pool.map(self._head_s3_etag, keys))
+            if cached.get("etags") == etags:
+                return cached["models"], cached["rules"]
+
+        # Fetch models.json and routing_rules.json from S3 concurrently,
+        # so cold-start latency is max(t1, t2) instead of t1 + t2
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            (models_data, models_etag), (rules_data, rules_etag) = pool.map(
+                self._read_s3_json, keys
+            )
+        self._write_tmp_cache([models_etag, rules_etag], models_data, rules_data)
+        return models_data, rules_data
+
+    def _read_s3_json(self, key: str) -> Tuple[Dict[str, Any], str]:
+        # boto3 clients are thread-safe, so the shared client is reused across workers
+        resp = self._s3.get_object(Bucket=self.bucket, Key=key)
+        return _json_loads(resp["Body"].read()), resp["ETag"]
+
+    def _head_s3_etag(self, key: str) -> str:
+        return self._s3.head_object(Bucket=self.bucket, Key=key)["ETag"]
+
+    def _read_tmp_cache(self) -> Dict[str, Any] | None:
+        if not self.tmp_cache_path or not os.path.isfile(self.tmp_cache_path):
+            return None
+        try:
+            return self._read_local_json(self.tmp_cache_path)
+        except (OSError, ValueError):
+            # Missing or partially written cache is treated as a miss
+            return None
+
+    def _write_tmp_cache(
+        self, etags: List[str], models_data: Dict[str, Any], rules_data: Dict[str, Any]
+    ) -> None:
+        if not self.tmp_cache_path:
+            return
+        payload = {"etags": etags, "models": models_data, "rules": rules_data}
+        tmp_path = f"{self.tmp_cache_path}.{os.getpid()}"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            # Atomic swap so concurrent readers never see a partial file
+            os.replace(tmp_path, self.tmp_cache_path)
+        except OSError:
+            # The cache is an optimization only; an unwritable /tmp must not fail loading
+            pass
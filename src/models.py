@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Callable, Dict, List, Optional, Literal
 
 
 CostTier = Literal["low", "medium", "high"]
 TenantTier = Literal["free", "standard", "premium", "internal"]
 TaskType = Literal["chat", "embedding"]
 
+RULE_TREE_WILDCARD = "*"
+
 
 @dataclass
 class RetryPolicy:
@@ -31,13 +33,13 @@ class ModelConfig:
     retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RuleConditionRange:
     gte: Optional[int] = None
     lt: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RuleCondition:
     task_type: Optional[TaskType] = None
     complexity: Optional[str] = None
@@ -47,12 +49,16 @@ class RuleCondition:
     chunk_tokens_range: Optional[RuleConditionRange] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoutingRule:
     id: str
     when: RuleCondition
     use_model: str
     override_params: Dict[str, Any] = field(default_factory=dict)
+    # Precompiled matcher for `when`, built once at config load time
+    match: Optional[Callable[["FeatureSummary"], bool]] = field(
+        default=None, repr=False, compare=False
+    )
 
 
 @dataclass
@@ -61,9 +67,12 @@ class RouterConfig:
     rules: List[RoutingRule]
     default_chat_model_id: Optional[str] = None
     default_embedding_model_id: Optional[str] = None
+    # Two-level decision tree: task_type -> complexity -> candidate rules (in original order).
+    # RULE_TREE_WILDCARD stands for any value not named by a rule.
+    rule_tree: Dict[str, Dict[str, List[RoutingRule]]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaskDescriptor:
     text: str
     task_type: TaskType = "chat"
@@ -73,7 +82,7 @@ class TaskDescriptor:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeatureSummary:
     task_type: TaskType
     token_count: int
@@ -84,7 +93,7 @@ class FeatureSummary:
     tenant_tier: TenantTier
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelSelection:
     model_config: ModelConfig
     params: Dict[str, Any]
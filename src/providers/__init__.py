@@ -1,7 +1,25 @@
+from importlib import import_module
+from typing import Any
+
 from .base import BaseProviderClient
-from .bedrock_client import BedrockProviderClient
-from .anthropic_client import AnthropicProviderClient
-from .gemini_client import GeminiProviderClient
+
+# Provider clients are imported on first access (PEP 562) so an invocation only
+# pays the import cost of the SDK it actually uses.
+_LAZY_CLIENTS = {
+    "BedrockProviderClient": ".bedrock_client",
+    "AnthropicProviderClient": ".anthropic_client",
+    "GeminiProviderClient": ".gemini_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_CLIENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BaseProviderClient",
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-import anthropic
-
 from .base import BaseProviderClient
 
 
@@ -12,11 +10,14 @@ class AnthropicProviderClient(BaseProviderClient):
     Anthropic Claude client using anthropic SDK.
     """
 
-    def __init__(self, model_id: str, params: Dict[str, Any]) -> None:
-        super().__init__(model_id, params)
+    def __init__(self, model_id: str) -> None:
+        super().__init__(model_id)
+        # Imported here so the SDK only loads when an Anthropic model is used
+        import anthropic
+
         self._client = anthropic.Anthropic()  # API key via env var
 
-    def chat(self, messages: List[Dict[str, Any]]) -> Any:
+    def chat(self, messages: List[Dict[str, Any]], params: Dict[str, Any]) -> Any:
         # Convert OpenAI-style messages to Claude messages
         claude_messages = []
         for m in messages:
@@ -27,13 +28,13 @@ class AnthropicProviderClient(BaseProviderClient):
 
         resp = self._client.messages.create(
             model=self.model_id,
-            max_tokens=self.params.get("max_tokens", 4096),
-            temperature=self.params.get("temperature", 0.3),
-            top_p=self.params.get("top_p", 0.9),
+            max_tokens=params.get("max_tokens", 4096),
+            temperature=params.get("temperature", 0.3),
+            top_p=params.get("top_p", 0.9),
             messages=claude_messages,
         )
         return resp
 
-    def embed(self, text: str) -> Any:
+    def embed(self, text: str, params: Dict[str, Any]) -> Any:
         # If you use Claude embeddings in future – placeholder
         raise NotImplementedError("Embeddings not implemented for Anthropic")
@@ -7,16 +7,18 @@ from typing import Any, Dict, List
 class BaseProviderClient(ABC):
     """
     Abstract base for provider-specific clients.
+
+    Clients are bound to a model_id only and are reused across requests;
+    per-request inference params are passed into chat()/embed().
     """
 
-    def __init__(self, model_id: str, params: Dict[str, Any]) -> None:
+    def __init__(self, model_id: str) -> None:
         self.model_id = model_id
-        self.params = params
 
     @abstractmethod
-    def chat(self, messages: List[Dict[str, Any]]) -> Any:
+    def chat(self, messages: List[Dict[str, Any]], params: Dict[str, Any]) -> Any:
         raise NotImplementedError
 
     @abstractmethod
-    def embed(self, text: str) -> Any:
+    def embed(self, text: str, params: Dict[str, Any]) -> Any:
         raise NotImplementedError
@@ -1,23 +1,46 @@
 from __future__ import annotations
 
 import json
+import logging
+import threading
 from typing import Any, Dict, List
 
 import boto3
+from botocore.config import Config
 
 from .base import BaseProviderClient
 
+logger = logging.getLogger(__name__)
+
+# One bedrock-runtime client (and HTTP connection pool) shared by every
+# BedrockProviderClient. botocore's default retries stay enabled so transient
+# 5xx / connection errors are still retried below the router's throttling fallback.
+_RUNTIME_CONFIG = Config(max_pool_connections=50, tcp_keepalive=True)
+_runtime = None
+_runtime_lock = threading.Lock()
+
+
+def _shared_runtime() -> Any:
+    global _runtime
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                _runtime = boto3.client("bedrock-runtime", config=_RUNTIME_CONFIG)
+    return _runtime
+
 
 class BedrockProviderClient(BaseProviderClient):
     """
     Bedrock client wrapper using boto3 for text models and embeddings.
     """
 
-    def __init__(self, model_id: str, params: Dict[str, Any]) -> None:
-        super().__init__(model_id, params)
-        self._runtime = boto3.client("bedrock-runtime")
+    def __init__(self, model_id: str) -> None:
+        super().__init__(model_id)
+        self._runtime = _shared_runtime()
+        # Anthropic Claude Sonnet 4.5 on Bedrock rejects topP alongside temperature
+        self._supports_top_p = "sonnet-4-5" not in model_id
 
-    def chat(self, messages: List[Dict[str, Any]]) -> Any:
+    def chat(self, messages: List[Dict[str, Any]], params: Dict[str, Any]) -> Any:
         """
         Chat wrapper for Bedrock models using the Converse API.
 
@@ -50,13 +73,12 @@ class BedrockProviderClient(BaseProviderClient):
                 )
 
         inference_config = {
-            "maxTokens": self.params.get("max_tokens", 4096),
-            "temperature": self.params.get("temperature", 0.2),
+            "maxTokens": params.get("max_tokens", 4096),
+            "temperature": params.get("temperature", 0.2),
         }
-        if "sonnet-4-5" not in self.model_id:
-            # Anthropic Claude-specific config adjustments
-            inference_config["topP"] = self.params.get("top_p", 0.8)
-            
+        if self._supports_top_p:
+            inference_config["topP"] = params.get("top_p", 0.8)
+
         body_kwargs: Dict[str, Any] = {
             "modelId": self.model_id,
             "messages": bedrock_messages,
@@ -66,8 +88,8 @@ class BedrockProviderClient(BaseProviderClient):
             # Converse API: "system" is a list of content blocks
             body_kwargs["system"] = system_prompts
 
-        print(f"==============> Bedrock converse model_id:{self.model_id} body: {body_kwargs}")
-        print(f"<==============")
+        # Lazy %-formatting: the body is only rendered when DEBUG logging is enabled
+        logger.debug("Bedrock converse model_id:%s body: %s", self.model_id, body_kwargs)
 
         # NOTE: Converse uses the 'converse' operation, not invoke_model
         resp = self._runtime.converse(**body_kwargs)
@@ -76,17 +98,17 @@ class BedrockProviderClient(BaseProviderClient):
         # resp["output"]["message"]["content"][0]["text"]
         return resp
 
-    def embed(self, text: str) -> Any:
+    def embed(self, text: str, params: Dict[str, Any]) -> Any:
         body = {
             "inputText": text,
         }
-        
-        print(f"==============> Bedrock embedded model_id:{self.model_id} body: {json.dumps(body)}")
-        print(f"<==============")
+        # Serialize once and reuse for both the debug log and the request
+        serialized = json.dumps(body)
+        logger.debug("Bedrock embedded model_id:%s body: %s", self.model_id, serialized)
 
         resp = self._runtime.invoke_model(
             modelId=self.model_id,
-            body=json.dumps(body),
+            body=serialized,
             contentType="application/json",
             accept="application/json",
         )
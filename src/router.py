@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 from .config_loader import ConfigLoader
 from .models import (
@@ -11,16 +16,41 @@ from .models import (
     TaskDescriptor,
     FeatureSummary,
     ModelConfig,
+    RoutingRule,
+    RULE_TREE_WILDCARD,
 )
-from .providers import (
-    BaseProviderClient,
-    BedrockProviderClient,
-    AnthropicProviderClient,
-    GeminiProviderClient,
-)
+from .providers import BaseProviderClient
+from .utils.rule_compiler import compile_condition
 from .utils.text_analysis import build_feature_summary
 from .utils.exceptions import ThrottlingError
 
+# Name prefix of the worker threads running hedged primary-retry / backup calls
+HEDGE_THREAD_PREFIX = "model-router-hedge"
+
+# botocore ClientError codes that signal throttling / quota pressure
+_BOTO_THROTTLING_CODES = frozenset(
+    {"ThrottlingException", "TooManyRequestsException", "ServiceQuotaExceededException"}
+)
+# Message scan used only for exception types we cannot classify structurally
+_THROTTLING_KEYWORDS = (
+    "throttling",
+    "rate limit",
+    "too many requests",
+    "tokens per minute",
+)
+
+
+def _throttling_exception_types() -> Tuple[type, ...]:
+    # Only consult SDKs that are already loaded; never import one just to classify an error
+    types: List[type] = []
+    anthropic = sys.modules.get("anthropic")
+    if anthropic is not None:
+        types.append(anthropic.RateLimitError)
+    google_exceptions = sys.modules.get("google.api_core.exceptions")
+    if google_exceptions is not None:
+        types.append(google_exceptions.ResourceExhausted)
+    return tuple(types)
+
 
 class ModelRouter:
     """
@@ -29,9 +59,14 @@ class ModelRouter:
       answer = handle.chat(messages=[...])
     """
 
+    # Max distinct feature signatures whose selection is kept in memory
+    SELECTION_CACHE_SIZE = 256
+
     def __init__(self, config_loader: Optional[ConfigLoader] = None) -> None:
         self._config_loader = config_loader or ConfigLoader()
-        self._config: RouterConfig = self._config_loader.get_config()
+        # Provider clients keyed by (provider, model_id), reused across warm invocations
+        self._client_cache: Dict[Tuple[str, str], BaseProviderClient] = {}
+        self._set_config(self._config_loader.get_config())
 
     # ---------- Public API ----------
 
@@ -54,20 +89,80 @@ class ModelRouter:
         )
         features = build_feature_summary(task)
         selection = self._select_model_for_features(features)
-        provider_client = self._create_provider_client(selection.model_config, selection.params)
+        provider_client = self._get_provider_client(selection.model_config)
         return ModelHandle(selection, provider_client, self)
 
+    def reload_config(self) -> None:
+        """Force a config reload and drop selections cached for the old config."""
+        self._set_config(self._config_loader.get_config(force_reload=True))
+
+    def _set_config(self, config: RouterConfig) -> None:
+        self._config = config
+        # Token-range thresholds used by the rules; features falling between the same
+        # thresholds match the same rules, so the bucket index is a safe cache key
+        self._context_breakpoints = self._range_breakpoints(
+            r.when.context_tokens_range for r in config.rules
+        )
+        self._chunk_breakpoints = self._range_breakpoints(
+            r.when.chunk_tokens_range for r in config.rules
+        )
+        self._selection_cache: "OrderedDict[Hashable, ModelSelection]" = OrderedDict()
+
+    @staticmethod
+    def _range_breakpoints(ranges) -> List[int]:
+        points = set()
+        for rng in ranges:
+            if rng is None:
+                continue
+            if rng.gte is not None:
+                points.add(rng.gte)
+            if rng.lt is not None:
+                points.add(rng.lt)
+        return sorted(points)
+
     # ---------- Internal: selection ----------
 
     def _select_model_for_features(self, features: FeatureSummary) -> ModelSelection:
-        # Try rules
-        for rule in self._config.rules:
+        key = self._selection_key(features)
+        selection = self._selection_cache.get(key)
+        if selection is None:
+            selection = self._resolve_selection(features)
+            self._selection_cache[key] = selection
+            if len(self._selection_cache) > self.SELECTION_CACHE_SIZE:
+                self._selection_cache.popitem(last=False)
+        else:
+            self._selection_cache.move_to_end(key)
+
+        # Pre-call context size check (uses exact sizes, so never cached)
+        self._ensure_context_limit(selection.model_config, features)
+        # Each request gets its own params dict, so callers mutating
+        # handle.selection.params cannot leak into the cached entry
+        return ModelSelection(model_config=selection.model_config, params=dict(selection.params))
+
+    def _selection_key(self, features: FeatureSummary) -> Hashable:
+        return (
+            features.task_type,
+            features.size_class,
+            features.language,
+            features.complexity,
+            features.tenant_tier,
+            bisect_right(self._context_breakpoints, features.context_tokens),
+            bisect_right(self._chunk_breakpoints, features.token_count),
+        )
+
+    def _resolve_selection(self, features: FeatureSummary) -> ModelSelection:
+        # Try rules (only the rule tree leaf for this task_type / complexity)
+        rule_tree = self._config.rule_tree
+        if rule_tree:
+            by_complexity = rule_tree.get(features.task_type, rule_tree[RULE_TREE_WILDCARD])
+            candidates = by_complexity.get(features.complexity, by_complexity[RULE_TREE_WILDCARD])
+        else:
+            candidates = self._config.rules
+        for rule in candidates:
             if self._rule_matches(rule, features):
                 model_cfg = self._config.models[rule.use_model]
                 params = dict(model_cfg.default_params)
                 params.update(rule.override_params)
-                # Pre-call context size check
-                self._ensure_context_limit(model_cfg, features)
                 return ModelSelection(model_config=model_cfg, params=params)
 
         # Fall back to defaults
@@ -80,36 +175,12 @@ class ModelRouter:
             raise RuntimeError(f"No default model configured for task_type={features.task_type}")
 
         model_cfg = self._config.models[default_id]
-        self._ensure_context_limit(model_cfg, features)
         return ModelSelection(model_config=model_cfg, params=dict(model_cfg.default_params))
 
-    def _rule_matches(self, rule, features: FeatureSummary) -> bool:
-        cond = rule.when
-        # task_type
-        if cond.task_type and cond.task_type != features.task_type:
-            return False
-        # complexity
-        if cond.complexity and cond.complexity != features.complexity:
-            return False
-        # language
-        if cond.language and cond.language != features.language:
-            return False
-        # tenant tier
-        if cond.tenant_tiers and features.tenant_tier not in cond.tenant_tiers:
-            return False
-        # context tokens
-        if cond.context_tokens_range:
-            if cond.context_tokens_range.gte is not None and features.context_tokens < cond.context_tokens_range.gte:
-                return False
-            if cond.context_tokens_range.lt is not None and features.context_tokens >= cond.context_tokens_range.lt:
-                return False
-        # chunk tokens (for embedding)
-        if cond.chunk_tokens_range:
-            if cond.chunk_tokens_range.gte is not None and features.token_count < cond.chunk_tokens_range.gte:
-                return False
-            if cond.chunk_tokens_range.lt is not None and features.token_count >= cond.chunk_tokens_range.lt:
-                return False
-        return True
+    def _rule_matches(self, rule: RoutingRule, features: FeatureSummary) -> bool:
+        # Rules not built by ConfigLoader carry no precompiled matcher
+        match = rule.match or compile_condition(rule.when)
+        return match(features)
 
     def _ensure_context_limit(self, model_cfg: ModelConfig, features: FeatureSummary) -> None:
         if features.task_type == "chat" and model_cfg.max_context_tokens:
@@ -129,15 +200,28 @@ class ModelRouter:
 
     # ---------- Internal: provider clients ----------
 
-    def _create_provider_client(
-        self, model_cfg: ModelConfig, params: Dict[str, Any]
-    ) -> BaseProviderClient:
+    def _get_provider_client(self, model_cfg: ModelConfig) -> BaseProviderClient:
+        key = (model_cfg.provider, model_cfg.model_id)
+        client = self._client_cache.get(key)
+        if client is None:
+            client = self._create_provider_client(model_cfg)
+            self._client_cache[key] = client
+        return client
+
+    def _create_provider_client(self, model_cfg: ModelConfig) -> BaseProviderClient:
+        # Provider modules are imported lazily so unused SDKs never load
         if model_cfg.provider == "bedrock":
-            return BedrockProviderClient(model_cfg.model_id, params)
+            from .providers import BedrockProviderClient
+
+            return BedrockProviderClient(model_cfg.model_id)
         if model_cfg.provider == "anthropic":
-            return AnthropicProviderClient(model_cfg.model_id, params)
+            from .providers import AnthropicProviderClient
+
+            return AnthropicProviderClient(model_cfg.model_id)
         if model_cfg.provider == "gemini":
-            return GeminiProviderClient(model_cfg.model_id, params)
+            from .providers import GeminiProviderClient
+
+            return GeminiProviderClient(model_cfg.model_id)
         raise ValueError(f"Unsupported provider: {model_cfg.provider}")
 
     # ---------- Internal: throttling + fallback ----------
@@ -151,61 +235,142 @@ class ModelRouter:
         model_cfg = selection.model_config
         policy = model_cfg.retry_policy
 
-        # 1) Retry primary model
-        attempt = 0
-        while True:
-            attempt += 1
-            try:
-                return func(func_arg)
-            except Exception as e:
-                if not self._is_throttling_error(e):
-                    raise
-                if attempt >= policy.max_attempts:
-                    break
-                time.sleep(policy.backoff_ms / 1000.0)
+        def call_primary() -> Any:
+            return func(func_arg, selection.params)
 
-        # 2) Fallback to backup model if configured
-        if not model_cfg.backup_model_id:
-            raise ThrottlingError(
-                f"Primary model {model_cfg.id} throttled and no backup_model_id configured"
-            )
+        # 1) First attempt on the primary model
+        try:
+            return call_primary()
+        except Exception as e:
+            if not self._is_throttling_error(e):
+                raise
+
+        backup_cfg = (
+            self._config.models.get(model_cfg.backup_model_id)
+            if model_cfg.backup_model_id
+            else None
+        )
 
-        backup_cfg = self._config.models.get(model_cfg.backup_model_id)
-        if not backup_cfg:
+        # 2) No usable backup: keep retrying the primary model serially
+        if backup_cfg is None:
+            try:
+                return self._retry_on_throttle(
+                    call_primary, policy.max_attempts - 1, policy.backoff_ms, sleep_first=True
+                )
+            except ThrottlingError:
+                pass
+            if not model_cfg.backup_model_id:
+                raise ThrottlingError(
+                    f"Primary model {model_cfg.id} throttled and no backup_model_id configured"
+                )
             raise ThrottlingError(
                 f"Backup model {model_cfg.backup_model_id} for {model_cfg.id} not found in config"
             )
 
+        # 3) Hedge: call the backup model right away while the primary retries
+        #    after its backoff, and return whichever succeeds first
         # Use same base params, but from backup config defaults
         backup_params = dict(backup_cfg.default_params)
-        backup_selection = ModelSelection(model_config=backup_cfg, params=backup_params)
-        backup_client = self._create_provider_client(backup_cfg, backup_params)
+        backup_client = self._get_provider_client(backup_cfg)
+        backup_func = backup_client.chat if backup_cfg.type == "chat" else backup_client.embed
+        backup_policy = backup_cfg.retry_policy
 
-        attempt = 0
-        while True:
-            attempt += 1
-            try:
-                if backup_cfg.type == "chat":
-                    return backup_client.chat(func_arg)
-                else:
-                    return backup_client.embed(func_arg)
-            except Exception as e:
-                if not self._is_throttling_error(e):
-                    raise
-                if attempt >= backup_cfg.retry_policy.max_attempts:
-                    break
-                time.sleep(backup_cfg.retry_policy.backoff_ms / 1000.0)
+        def call_backup() -> Any:
+            return backup_func(func_arg, backup_params)
 
+        # Set once a winner is found, so the other side stops before its next attempt
+        stop = threading.Event()
+        # A pool per hedge: a losing call may run for the length of an LLM request,
+        # and must not hold a worker that a later hedge needs
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix=HEDGE_THREAD_PREFIX)
+        futures = [
+            pool.submit(
+                self._retry_on_throttle,
+                call_backup,
+                backup_policy.max_attempts,
+                backup_policy.backoff_ms,
+                False,
+                stop,
+            )
+        ]
+        if policy.max_attempts > 1:
+            futures.append(
+                pool.submit(
+                    self._retry_on_throttle,
+                    call_primary,
+                    policy.max_attempts - 1,
+                    policy.backoff_ms,
+                    True,
+                    stop,
+                )
+            )
+
+        error: Optional[BaseException] = None
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    exc = future.exception()
+                    if exc is None:
+                        # A call already sent cannot be interrupted and drains in the
+                        # background; one still backing off is stopped by `stop`
+                        return future.result()
+                    if error is None and not isinstance(exc, ThrottlingError):
+                        error = exc
+        finally:
+            stop.set()
+            for other in pending:
+                other.cancel()
+            # Don't wait for the loser; its worker exits once the call returns
+            pool.shutdown(wait=False)
+
+        if error is not None:
+            raise error
         raise ThrottlingError(
             f"Primary model {model_cfg.id} and backup {backup_cfg.id} both throttled"
         )
 
+    def _retry_on_throttle(
+        self,
+        call: Callable[[], Any],
+        attempts: int,
+        backoff_ms: int,
+        sleep_first: bool = False,
+        stop: Optional[threading.Event] = None,
+    ) -> Any:
+        """
+        Runs call() up to `attempts` times, backing off between throttled attempts.
+        Non-throttling errors propagate; exhausting all attempts raises ThrottlingError.
+        If `stop` is set (another hedged call won), no further attempt is made.
+        """
+        for attempt in range(attempts):
+            if attempt or sleep_first:
+                if stop is None:
+                    time.sleep(backoff_ms / 1000.0)
+                elif stop.wait(backoff_ms / 1000.0):
+                    raise ThrottlingError("Hedged call stopped: another call already won")
+            if stop is not None and stop.is_set():
+                raise ThrottlingError("Hedged call stopped: another call already won")
+            try:
+                return call()
+            except Exception as e:
+                if not self._is_throttling_error(e):
+                    raise
+        raise ThrottlingError(f"Throttled after {attempts} attempt(s)")
+
     def _is_throttling_error(self, exc: Exception) -> bool:
+        # Known SDK throttling exception types
+        if isinstance(exc, _throttling_exception_types()):
+            return True
+
+        # botocore ClientError: dispatch on the service error code
+        response = getattr(exc, "response", None)
+        if isinstance(response, dict):
+            code = response.get("Error", {}).get("Code")
+            if code:
+                return code in _BOTO_THROTTLING_CODES
+
+        # Unknown exception types: fall back to scanning the message
         msg = str(exc).lower()
-        throttling_keywords = [
-            "throttling",
-            "rate limit",
-            "too many requests",
-            "tokens per minute",
-        ]
-        return any(k in msg for k in throttling_keywords)
+        return any(k in msg for k in _THROTTLING_KEYWORDS)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, List, Tuple
+
+from ..models import FeatureSummary, RuleCondition, RuleConditionRange
+
+MatchFn = Callable[[FeatureSummary], bool]
+
+
+def _range_bounds(rng: RuleConditionRange) -> Tuple[float, float]:
+    gte = rng.gte if rng.gte is not None else -math.inf
+    lt = rng.lt if rng.lt is not None else math.inf
+    return gte, lt
+
+
+def compile_condition(cond: RuleCondition) -> MatchFn:
+    # Build a matcher with only the checks this condition actually uses,
+    # so runtime matching never branches on unset (None) fields.
+    checks: List[MatchFn] = []
+
+    if cond.task_type:
+        task_type = cond.task_type
+        checks.append(lambda f: f.task_type == task_type)
+    if cond.complexity:
+        complexity = cond.complexity
+        checks.append(lambda f: f.complexity == complexity)
+    if cond.language:
+        language = cond.language
+        checks.append(lambda f: f.language == language)
+    if cond.tenant_tiers:
+        tiers = cond.tenant_tiers
+        # A bare string is one tier, not a set of characters
+        tenant_tiers = frozenset([tiers] if isinstance(tiers, str) else tiers)
+        checks.append(lambda f: f.tenant_tier in tenant_tiers)
+
+    # Token ranges: unset bounds become sentinels, so each range is one chained comparison
+    ctx_range = cond.context_tokens_range
+    if ctx_range and (ctx_range.gte is not None or ctx_range.lt is not None):
+        ctx_gte, ctx_lt = _range_bounds(ctx_range)
+        checks.append(lambda f: ctx_gte <= f.context_tokens < ctx_lt)
+
+    # chunk tokens (for embedding)
+    chunk_range = cond.chunk_tokens_range
+    if chunk_range and (chunk_range.gte is not None or chunk_range.lt is not None):
+        chunk_gte, chunk_lt = _range_bounds(chunk_range)
+        checks.append(lambda f: chunk_gte <= f.token_count < chunk_lt)
+
+    if not checks:
+        return lambda f: True
+    if len(checks) == 1:
+        return checks[0]
+
+    compiled = tuple(checks)
+
+    def match(features: FeatureSummary) -> bool:
+        for check in compiled:
+            if not check(features):
+                return False
+        return True
+
+    return match
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+
+def intern_literal(value: Any) -> Any:
+    # Routing literals (task types, tiers, languages) come from small closed sets;
+    # interning them lets equality checks short-circuit on identity. sys.intern
+    # only accepts exact str, so anything else (e.g. StrEnum members) is returned
+    # unchanged and still compares with ==.
+    return sys.intern(value) if type(value) is str else value
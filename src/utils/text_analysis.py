@@ -1,13 +1,47 @@
 from __future__ import annotations
 
-from typing import Literal
+import re
+from typing import Literal, Tuple
 
 from ..models import FeatureSummary, TaskDescriptor, TenantTier
+from .strings import intern_literal
+
+# Keywords that mark a request as complex; single case-insensitive pass, no lowered copy
+_COMPLEXITY_RE = re.compile(r"explain in detail|architecture", re.IGNORECASE)
+
+
+def _count_ascii(text: str) -> int:
+    # Both the check and the count run in C, not a per-char Python loop
+    return len(text) if text.isascii() else len(text.encode("ascii", "ignore"))
+
+
+def _scan(text: str) -> Tuple[int, int, bool]:
+    # Text statistics shared by all features, computed once per request:
+    # (length, ascii_char_count, has_complexity_keyword).
+    # Up to three C-level passes: isascii(), an encode() only for non-ASCII text,
+    # and the keyword regex search.
+    return len(text), _count_ascii(text), _COMPLEXITY_RE.search(text) is not None
+
+
+def _language_from_counts(length: int, ascii_chars: int) -> str:
+    # Very simple heuristic: if mostly ASCII, assume "en", else "multi"
+    ratio = ascii_chars / max(1, length)
+    return "en" if ratio > 0.8 else "multi"
+
+
+def _complexity_from_scan(length: int, has_keyword: bool) -> str:
+    if has_keyword:
+        return "high"
+    if length > 1000:
+        return "high"
+    if length > 300:
+        return "medium"
+    return "low"
 
 
 def estimate_tokens(text: str) -> int:
-    # Very simple heuristic: ~4 chars per token
-    return max(1, len(text) // 4)
+    # Very simple heuristic: ~4 chars per token (at least 1)
+    return (len(text) >> 2) or 1
 
 
 def classify_size(token_count: int) -> str:
@@ -19,33 +53,26 @@ def classify_size(token_count: int) -> str:
 
 
 def detect_language(text: str) -> str:
-    # Very simple heuristic: if mostly ASCII, assume "en", else "multi"
-    ascii_chars = sum(1 for c in text if ord(c) < 128)
-    ratio = ascii_chars / max(1, len(text))
-    return "en" if ratio > 0.8 else "multi"
+    return _language_from_counts(len(text), _count_ascii(text))
 
 
 def estimate_complexity(text: str) -> str:
-    length = len(text)
-    lowercase = text.lower()
-    if "explain in detail" in lowercase or "architecture" in lowercase:
-        return "high"
-    if length > 1000:
-        return "high"
-    if length > 300:
-        return "medium"
-    return "low"
+    return _complexity_from_scan(len(text), _COMPLEXITY_RE.search(text) is not None)
 
 
 def build_feature_summary(task: TaskDescriptor) -> FeatureSummary:
-    tokens = estimate_tokens(task.text)
+    length, ascii_chars, has_keyword = _scan(task.text)
+    # Inlined estimate_tokens on the already-computed length
+    tokens = (length >> 2) or 1
     size_class = classify_size(tokens)
-    language = detect_language(task.text)
-    complexity = estimate_complexity(task.text)
+    language = _language_from_counts(length, ascii_chars)
+    complexity = _complexity_from_scan(length, has_keyword)
     context_tokens = task.context_tokens or 0
-    tenant_tier: TenantTier = task.tenant_tier
+    # Caller-supplied strings are interned to match the interned rule literals;
+    # language/complexity/size_class are code constants and already interned
+    tenant_tier: TenantTier = intern_literal(task.tenant_tier)
     return FeatureSummary(
-        task_type=task.task_type,
+        task_type=intern_literal(task.task_type),
         token_count=tokens,
         size_class=size_class,
         language=language,
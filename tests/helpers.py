@@ -0,0 +1,31 @@
+import os
+from unittest import mock
+
+from src.config_loader import ConfigLoader
+from src.models import RouterConfig
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StaticConfigLoader:
+    """Config loader stand-in that always returns the given RouterConfig."""
+
+    def __init__(self, config: RouterConfig) -> None:
+        self._config = config
+
+    def get_config(self, force_reload: bool = False) -> RouterConfig:
+        return self._config
+
+
+def load_local_config(
+    models_path: str = os.path.join(REPO_ROOT, "models.json"),
+    rules_path: str = os.path.join(REPO_ROOT, "routing_rules.json"),
+) -> RouterConfig:
+    """Parses config files from disk through ConfigLoader (defaults to the repo's own)."""
+    env = {
+        "FETCH_DRIVE": "false",
+        "MODEL_ROUTER_MODELS_PATH": models_path,
+        "MODEL_ROUTER_RULES_PATH": rules_path,
+    }
+    with mock.patch.dict(os.environ, env):
+        return ConfigLoader().get_config()
@@ -0,0 +1,67 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from src.config_loader import ConfigLoader
+
+from tests.helpers import REPO_ROOT
+
+
+class _FakeS3:
+    """Serves the repo's config files as S3 objects and records requested keys."""
+
+    def __init__(self):
+        self.keys = []
+
+    def get_object(self, Bucket, Key):
+        self.keys.append(Key)
+        with open(os.path.join(REPO_ROOT, Key), "rb") as f:
+            return {"Body": io.BytesIO(f.read()), "ETag": f'"{Key}"'}
+
+
+class BundledConfigTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.bundle_dir = tmp.name
+        with open(os.path.join(self.bundle_dir, "config_manifest.json"), "w") as f:
+            json.dump({"version": "v1"}, f)
+        env = {
+            "FETCH_DRIVE": "true",
+            "MODEL_ROUTER_CONFIG_BUCKET": "bucket",
+            "MODEL_ROUTER_BUNDLE_DIR": self.bundle_dir,
+            "MODEL_ROUTER_TMP_CACHE_PATH": "",
+            "CONFIG_VERSION": "v1",
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _load(self):
+        loader = ConfigLoader()
+        loader._s3 = _FakeS3()
+        return loader, loader.get_config()
+
+    def _bundle(self, *names):
+        for name in names:
+            shutil.copy(os.path.join(REPO_ROOT, name), self.bundle_dir)
+
+    def test_complete_bundle_skips_s3(self):
+        self._bundle("models.json", "routing_rules.json")
+        loader, config = self._load()
+        self.assertEqual(loader._s3.keys, [])
+        self.assertTrue(config.rules)
+
+    def test_bundle_missing_a_file_falls_back_to_s3(self):
+        self._bundle("models.json")
+        loader, config = self._load()
+        self.assertEqual(sorted(loader._s3.keys), ["models.json", "routing_rules.json"])
+        self.assertTrue(config.rules)
+
+
+if __name__ == "__main__":
+    unittest.main()
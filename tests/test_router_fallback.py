@@ -0,0 +1,144 @@
+import dataclasses
+import threading
+import unittest
+
+from src.models import ModelConfig, ModelSelection, RetryPolicy, RouterConfig
+from src.router import HEDGE_THREAD_PREFIX, ModelRouter
+from src.utils.exceptions import ThrottlingError
+
+from tests.helpers import StaticConfigLoader
+
+
+class _FakeClient:
+    """Provider client whose n-th call returns/raises outcomes[n] (last one repeats)."""
+
+    def __init__(self, name, calls, outcomes, gate=None):
+        self.name = name
+        self.calls = calls
+        self.outcomes = outcomes
+        self.gate = gate
+
+    def chat(self, messages, params):
+        index = sum(1 for c in self.calls if c == self.name)
+        self.calls.append(self.name)
+        if self.gate is not None:
+            self.gate.wait(30)
+        outcome = self.outcomes[min(index, len(self.outcomes) - 1)]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    embed = chat
+
+
+def _throttled():
+    return Exception("ThrottlingException: rate limit exceeded")
+
+
+class _ObservedRouter(ModelRouter):
+    """Signals when a hedged primary retry has started and is backing off."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.primary_backing_off = threading.Event()
+
+    def _retry_on_throttle(self, call, attempts, backoff_ms, sleep_first=False, stop=None):
+        if sleep_first:
+            self.primary_backing_off.set()
+        return super()._retry_on_throttle(call, attempts, backoff_ms, sleep_first, stop)
+
+
+def _join_hedge_threads(timeout):
+    for thread in threading.enumerate():
+        if thread.name.startswith(HEDGE_THREAD_PREFIX):
+            thread.join(timeout)
+    return [t for t in threading.enumerate() if t.name.startswith(HEDGE_THREAD_PREFIX)]
+
+
+class HedgedFallbackTest(unittest.TestCase):
+    BACKOFF_MS = 100
+
+    def setUp(self):
+        policy = RetryPolicy(max_attempts=2, backoff_ms=self.BACKOFF_MS)
+        self.primary_cfg = ModelConfig(
+            id="primary", provider="fake", type="chat", model_id="primary-model",
+            backup_model_id="backup", retry_policy=policy,
+        )
+        self.backup_cfg = ModelConfig(
+            id="backup", provider="fake", type="chat", model_id="backup-model",
+            retry_policy=policy,
+        )
+        config = RouterConfig(
+            models={"primary": self.primary_cfg, "backup": self.backup_cfg}, rules=[]
+        )
+        self.router = _ObservedRouter(config_loader=StaticConfigLoader(config))
+        self.calls = []
+        self.gate = threading.Event()
+
+    def tearDown(self):
+        # Release any fake call still blocked so worker threads can drain
+        self.gate.set()
+        _join_hedge_threads(timeout=10)
+
+    def _run(self, primary_outcomes, backup_outcomes, backup_gate=None, primary_cfg=None):
+        primary = _FakeClient("primary", self.calls, primary_outcomes)
+        backup = _FakeClient("backup", self.calls, backup_outcomes, gate=backup_gate)
+        self.router._client_cache[("fake", "backup-model")] = backup
+        selection = ModelSelection(model_config=primary_cfg or self.primary_cfg, params={})
+        return self.router._call_with_retry_and_fallback(selection, primary.chat, [])
+
+    def test_backup_wins_and_primary_retry_is_not_sent(self):
+        # The backup only answers once the primary retry is in its backoff, and that
+        # backoff is far longer than the test, so only the stop signal can end it
+        slow_primary = dataclasses.replace(
+            self.primary_cfg, retry_policy=RetryPolicy(max_attempts=2, backoff_ms=30_000)
+        )
+        result = self._run(
+            [_throttled()],
+            ["backup-ok"],
+            backup_gate=self.router.primary_backing_off,
+            primary_cfg=slow_primary,
+        )
+        self.assertEqual(result, "backup-ok")
+        self.assertEqual(_join_hedge_threads(timeout=10), [])
+        self.assertEqual(self.calls.count("primary"), 1)
+
+    def test_primary_retry_wins_while_backup_pending(self):
+        result = self._run([_throttled(), "primary-ok"], ["backup-ok"], backup_gate=self.gate)
+        self.assertEqual(result, "primary-ok")
+        self.assertEqual(self.calls.count("primary"), 2)
+
+    def test_running_losers_do_not_delay_later_hedges(self):
+        # Every backup blocks on the gate and loses, so earlier losers are still
+        # running when later hedges start; each primary retry must still run at once
+        for _ in range(6):
+            self.calls = []
+            results = []
+            worker = threading.Thread(
+                target=lambda: results.append(
+                    self._run([_throttled(), "primary-ok"], ["backup-ok"], backup_gate=self.gate)
+                ),
+                daemon=True,
+            )
+            worker.start()
+            worker.join(10)
+            self.assertFalse(worker.is_alive(), "hedge queued behind a running loser")
+            self.assertEqual(results, ["primary-ok"])
+
+    def test_both_throttled(self):
+        with self.assertRaises(ThrottlingError):
+            self._run([_throttled()], [_throttled()])
+        self.assertEqual(self.calls.count("primary"), 2)
+        self.assertEqual(self.calls.count("backup"), 2)
+
+    def test_non_throttling_error_raised_when_other_side_throttles(self):
+        with self.assertRaises(ValueError):
+            self._run([_throttled()], [ValueError("bad request")])
+
+    def test_non_throttling_error_does_not_hide_pending_success(self):
+        result = self._run([_throttled(), "primary-ok"], [ValueError("bad request")])
+        self.assertEqual(result, "primary-ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from src.models import ModelConfig, RouterConfig, TaskDescriptor
+from src.router import ModelRouter
+from src.utils.text_analysis import build_feature_summary
+
+from tests.helpers import StaticConfigLoader, load_local_config
+
+
+class SelectionCacheTest(unittest.TestCase):
+    def setUp(self):
+        model = ModelConfig(
+            id="chat", provider="fake", type="chat", model_id="chat-model",
+            default_params={"temperature": 0.2},
+        )
+        config = RouterConfig(models={"chat": model}, rules=[], default_chat_model_id="chat")
+        self.router = ModelRouter(config_loader=StaticConfigLoader(config))
+        self.router._client_cache[("fake", "chat-model")] = object()
+
+    def test_params_are_not_shared_between_requests(self):
+        first = self.router.select_model("hello")
+        first.selection.params["temperature"] = 1.0
+
+        second = self.router.select_model("hello")
+        self.assertEqual(second.selection.params, {"temperature": 0.2})
+        self.assertIsNot(first.selection.params, second.selection.params)
+
+
+class SelectionCacheBreakpointTest(unittest.TestCase):
+    """Cached selections must equal a full rule scan on both sides of a range bound."""
+
+    def setUp(self):
+        self.router = ModelRouter(config_loader=StaticConfigLoader(load_local_config()))
+
+    def _features(self, context_tokens):
+        return build_feature_summary(
+            TaskDescriptor(
+                text="Explain in detail the deployment pipeline.",
+                context_tokens=context_tokens,
+                tenant_tier="premium",
+            )
+        )
+
+    def test_context_either_side_of_8000_bound(self):
+        expected = {7999: "claude_sonnet_4_5", 8000: "bedrock_nova_pro"}
+        # Alternate so each lookup after the first two is served from the cache
+        for context_tokens in (7999, 8000, 7999, 8000):
+            features = self._features(context_tokens)
+            cached = self.router._select_model_for_features(features)
+            full_scan = self.router._resolve_selection(features)
+            self.assertEqual(cached.model_config.id, full_scan.model_config.id)
+            self.assertEqual(cached.params, full_scan.params)
+            self.assertEqual(cached.model_config.id, expected[context_tokens])
+        self.assertEqual(len(self.router._selection_cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
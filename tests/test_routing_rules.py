@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.models import TaskDescriptor
+from src.router import ModelRouter
+from src.utils.text_analysis import build_feature_summary
+
+from tests.helpers import REPO_ROOT, StaticConfigLoader, load_local_config
+
+COMPLEX_TEXT = "Explain in detail the deployment pipeline."
+
+
+class DefaultRoutingRulesTest(unittest.TestCase):
+    """Selection against the shipped routing_rules.json / models.json."""
+
+    def setUp(self):
+        self.router = ModelRouter(config_loader=StaticConfigLoader(load_local_config()))
+
+    def _select(self, text, **task_fields):
+        features = build_feature_summary(TaskDescriptor(text=text, **task_fields))
+        return self.router._select_model_for_features(features).model_config.id
+
+    def test_complex_large_context_chat(self):
+        model_id = self._select(COMPLEX_TEXT, context_tokens=9000, tenant_tier="premium")
+        self.assertEqual(model_id, "bedrock_nova_pro")
+
+    def test_complex_small_context_chat(self):
+        model_id = self._select(COMPLEX_TEXT, context_tokens=100, tenant_tier="free")
+        self.assertEqual(model_id, "claude_sonnet_4_5")
+
+    def test_embedding_large_english(self):
+        model_id = self._select("x" * 4 * 3000, task_type="embedding")
+        self.assertEqual(model_id, "bedrock_cohere_embed_english")
+
+    def test_embedding_small_english(self):
+        model_id = self._select("short chunk", task_type="embedding")
+        self.assertEqual(model_id, "bedrock_titan_embed_small")
+
+    def test_embedding_multilingual(self):
+        model_id = self._select("日本語のテキストです", task_type="embedding")
+        self.assertEqual(model_id, "bedrock_cohere_embed_multilingual")
+
+    def test_complexity_no_rule_names_uses_wildcard_leaf(self):
+        # "low" complexity is not named by any rule, so the wildcard leaf applies
+        model_id = self._select("What is the capital of France?", tenant_tier="premium")
+        self.assertEqual(model_id, "bedrock_nova_pro")
+
+    def test_no_rule_matches_falls_through_to_default(self):
+        # High complexity and large context, but "free" is outside the rule's tenant tiers
+        model_id = self._select(COMPLEX_TEXT, context_tokens=9000, tenant_tier="free")
+        self.assertEqual(model_id, "bedrock_nova_pro")
+
+
+class RuleConditionParsingTest(unittest.TestCase):
+    def _router_with_rules(self, rules, defaults):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        rules_path = os.path.join(tmp.name, "routing_rules.json")
+        with open(rules_path, "w", encoding="utf-8") as f:
+            json.dump({"rules": rules, "defaults": defaults}, f)
+        config = load_local_config(
+            models_path=os.path.join(REPO_ROOT, "models.json"), rules_path=rules_path
+        )
+        return ModelRouter(config_loader=StaticConfigLoader(config))
+
+    def test_empty_condition_values_are_unset(self):
+        router = self._router_with_rules(
+            [
+                {
+                    "id": "empty_strings",
+                    "when": {"task_type": "", "complexity": "", "language": ""},
+                    "use_model": "claude_sonnet_4_5",
+                }
+            ],
+            {"chat": "bedrock_nova_pro"},
+        )
+        features = build_feature_summary(TaskDescriptor(text="hello"))
+        selection = router._select_model_for_features(features)
+        self.assertEqual(selection.model_config.id, "claude_sonnet_4_5")
+
+    def test_scalar_tenant_tier_is_one_tier(self):
+        router = self._router_with_rules(
+            [
+                {
+                    "id": "premium_only",
+                    "when": {"task_type": "chat", "tenant_tier": "premium"},
+                    "use_model": "claude_sonnet_4_5",
+                }
+            ],
+            {"chat": "bedrock_nova_pro"},
+        )
+        for tier, expected in (("premium", "claude_sonnet_4_5"), ("free", "bedrock_nova_pro")):
+            features = build_feature_summary(TaskDescriptor(text="hello", tenant_tier=tier))
+            selection = router._select_model_for_features(features)
+            self.assertEqual(selection.model_config.id, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
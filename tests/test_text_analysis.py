@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+import unittest
+from enum import Enum
+
+from src.models import TaskDescriptor
+from src.router import ModelRouter
+from src.utils.text_analysis import build_feature_summary
+
+from tests.helpers import StaticConfigLoader, load_local_config
+
+
+class TaskKind(str, Enum):
+    CHAT = "chat"
+
+
+class TierKind(str, Enum):
+    FREE = "free"
+    PREMIUM = "premium"
+
+
+class BuildFeatureSummaryTest(unittest.TestCase):
+    def test_str_subclass_fields_are_accepted(self):
+        features = build_feature_summary(
+            TaskDescriptor(text="hello", task_type=TaskKind.CHAT, tenant_tier=TierKind.PREMIUM)
+        )
+        self.assertEqual(features.task_type, "chat")
+        self.assertEqual(features.tenant_tier, "premium")
+
+    def test_str_subclass_fields_route_like_plain_strings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            rules_path = os.path.join(tmp, "routing_rules.json")
+            with open(rules_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "rules": [
+                            {
+                                "id": "premium_chat",
+                                "when": {"task_type": "chat", "tenant_tier": ["premium"]},
+                                "use_model": "claude_sonnet_4_5",
+                            }
+                        ],
+                        "defaults": {"chat": "bedrock_nova_pro"},
+                    },
+                    f,
+                )
+            router = ModelRouter(
+                config_loader=StaticConfigLoader(load_local_config(rules_path=rules_path))
+            )
+
+        for tier, expected in (
+            (TierKind.PREMIUM, "claude_sonnet_4_5"),
+            (TierKind.FREE, "bedrock_nova_pro"),
+        ):
+            features = build_feature_summary(
+                TaskDescriptor(text="hello", task_type=TaskKind.CHAT, tenant_tier=tier)
+            )
+            selection = router._select_model_for_features(features)
+            self.assertEqual(selection.model_config.id, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()